@@ -7,7 +7,6 @@ import matplotlib.pyplot as plt
 from typing import List, Tuple
 from time import time
 import numpy as np
-import math
 import os
 
 from models import Drone, Depot, Destination, Supply
@@ -22,6 +21,9 @@ base_dir = os.path.dirname(__file__)
 WINDOW_SIZE     = (14, 7)
 LABELS_FONTSIZE = 10 # Μέγεθος γραμματοσειράς των labels στον χάρτη
 TABLE_FONTSIZE  = 12 # Μέγεθος γραμματοσειράς των πινάκων πληροφοριών
+# Σύμβολο κάλυψης ανά "κάδο" ποσοστού: [0, 50) -> ✗, [50, 90) -> !, [90, ...) -> ✓
+STATUS_BINS     = [50, 90]
+STATUS_MARKS    = np.array(['✗', '!', '✓'])
 
 class DroneAnimator:
     ''' Ανεξάρτητη κλάση για την οπτικοποίηση της παράδοσης
@@ -29,15 +31,25 @@ class DroneAnimator:
 
     def __init__(self,
                  scenario:      tuple[list[Drone], list[Depot], list[Destination]],
-                 map_path:      str   = None,
-                 dt:            float = 0.01,
-                 print_results: bool  = True) -> None:
+                 map_path:      str        = None,
+                 dt:            float      = 0.01,
+                 print_results: bool       = True,
+                 min_frames:    int        = 100,
+                 max_frames:    int | None = None) -> None:
         (self.drones, self.depots, self.destinations) = scenario
         
         start = time()
         self.assignments   = solve(self.drones, self.depots, self.destinations)
         self.solution_time = time() - start # Χρόνος επίλυσης
         
+        # Lookup tables - Χτίζονται 1 φορά εδώ, αντί για γραμμικές σαρώσεις παρακάτω!
+        self._assign_by_drone = {} # Ομαδοποίηση αναθέσεων ανά δρόνο
+        for a in self.assignments:
+            self._assign_by_drone.setdefault(a.drone_id, []).append(a)
+        self._drone_by_id = {d.id: d for d in self.drones}
+        self._depot_by_id = {d.id: d for d in self.depots}
+        self._dest_by_id  = {d.id: d for d in self.destinations}
+        
         if print_results:
             print(f'\n{self.__str__()}')
             self.print_satisfaction_rates()
@@ -49,22 +61,72 @@ class DroneAnimator:
         self.map_path = map_path
         self.dt       = dt
         
+        # Το status text ανανεώνεται 1 φορά ανά [προσομοιωμένο] δευτερόλεπτο
+        # ή όταν συμβεί κάποιο γεγονός - Όχι σε κάθε frame [text layout = ακριβό]!
+        self._text_interval = max(1, round(1 / dt)) if dt > 0 else 1
+        self._frame         = 0 # Τελευταίο frame που σχεδιάστηκε [για re-init]
+        
         # Δημιουργία διαδρομών για τους δρόνους & προγραμματισμός γεγονότων
         self.trajectories = {}
         self.drone_cargo  = {d.id: Supply() for d in self.drones} # Φορτίο κάθε δρόνου
+        # Ποιοι δρόνοι έχουν ενεργό φορτίο [ενημερώνεται ΜΟΝΟ σε pickup/drop]
+        self._drone_index = {d.id: k for (k, d) in enumerate(self.drones)}
+        self._in_flight   = np.zeros(len(self.drones), dtype = bool)
         self._events      = [] # Event schedule
         self._build_trajectories()
+        # Τα γεγονότα ομαδοποιημένα ανά frame - Αφού όλη η προσομοίωση είναι γνωστή
+        # εκ των προτέρων, το callback κάθε frame αγγίζει ΜΟΝΟ τα δικά του γεγονότα!
+        self._events_by_frame = {}
+        for event in self._events:
+            self._events_by_frame.setdefault(event[0], []).append(event)
+        # Διάρκεια = η μεγαλύτερη διαδρομή - Με idle δρόνους [χωρίς αναθέσεις],
+        # τουλάχιστον min_frames, ώστε να φαίνονται κι αυτοί για λίγο!
+        has_idle        = any(d.id not in self._assign_by_drone for d in self.drones)
         self.max_frames = max(
-            t.n_frames for t in self.trajectories.values()
-        ) if self.trajectories else 1
+            [t.n_frames for t in self.trajectories.values()] + [min_frames if has_idle else 1, 1]
+        )
+        # Προαιρετικό όριο στη διάρκεια του animation: Λιγότερα frames για render, αλλά
+        # ό,τι συμβαίνει μετά το όριο [αφίξεις, παραδόσεις] ΔΕΝ εμφανίζεται ποτέ!
+        if max_frames:
+            self.max_frames = min(self.max_frames, max_frames)
+        
+        # Πυκνός πίνακας (max_frames, n_drones, 2) με τις θέσεις όλων των δρόνων [SoA] -
+        # μετά το τέλος της διαδρομής του, κάθε δρόνος μένει στην τελευταία του θέση!
+        # Frame-major διάταξη: οι θέσεις ενός frame είναι 1 συνεχές (C-contiguous) block,
+        # οπότε δίνονται στο scatter ως view χωρίς αντιγραφή/strided πρόσβαση.
+        self._positions = np.empty((self.max_frames, len(self.drones), 2), dtype = np.float64)
+        for (k, drone) in enumerate(self.drones):
+            traj = self.trajectories[drone.id].positions[:self.max_frames]
+            self._positions[:len(traj), k] = traj
+            self._positions[len(traj):, k] = traj[-1]
         
         # Setup matplotlib
         self._setup_figure()
         self._setup_static_elements()
         self._setup_dynamic_elements()
         
-        # Animation state
-        self._dest_satisfied  = [False] * len(self.destinations) # Έλεγχος ολοκλήρωσης!
+        # Animation state - Έλεγχος ολοκλήρωσης!
+        self._dest_satisfied = np.zeros(len(self.destinations), dtype = bool)
+        # Τα ποσοστά κάλυψης αλλάζουν ΜΟΝΟ σε γεγονότα 'drop' - τα κρατάμε σε πίνακα!
+        self._dest_index = {d.id: k for (k, d) in enumerate(self.destinations)}
+        self._sat_rates  = np.array(
+            [d.sat_rate() for d in self.destinations], dtype = np.float64
+        )
+        # Frame 1ης άφιξης ανά σημείο ανάγκης [sentinel αν δεν του ανατέθηκε τίποτα]
+        no_arrival = np.iinfo(np.int64).max
+        self._dest_arrival = np.full(len(self.destinations), no_arrival, dtype = np.int64)
+        for traj in self.trajectories.values():
+            for (dest_id, arrival_frame) in traj.dest_frames:
+                k = self._dest_index[dest_id]
+                self._dest_arrival[k] = min(self._dest_arrival[k], arrival_frame)
+        # Μεταβάσεις χρώματος ως ταξινομημένη λίστα (frame, dest_idx) - Ένας cursor
+        # προχωράει σε αυτή, άρα δεν ξαναελέγχουμε όλα τα σημεία σε κάθε frame!
+        # [stable argsort => ισοπαλίες στο frame κρατούν τη σειρά των σημείων]
+        arrived           = np.flatnonzero(self._dest_arrival != no_arrival)
+        order             = arrived[np.argsort(self._dest_arrival[arrived], kind = 'stable')]
+        self._dest_events = [(int(self._dest_arrival[k]), int(k)) for k in order]
+        self._dest_cursor = 0
+        
         self._animation_stats = {
             'total_deliveries':     len(self.assignments),
             'completed_deliveries': 0,
@@ -81,11 +143,7 @@ class DroneAnimator:
             return '\n'.join(lines);
         
         # Ομαδοποίηση αναθέσεων ανά δρόνου -> καλύτερη οργάνωση
-        drone_assignments = {}
-        for a in self.assignments:
-            drone_assignments.setdefault(a.drone_id, []).append(a)
-        
-        for (drone_id, assignments) in sorted(drone_assignments.items()):
+        for (drone_id, assignments) in sorted(self._assign_by_drone.items()):
             lines.append(f'\nΔρόνος {drone_id}:')
             total_distance = 0
             for a in assignments:
@@ -107,16 +165,12 @@ class DroneAnimator:
         ''' Εκτύπωση ποσοστών κάλυψης προμηθειών ανά προορισμό. '''
 
         print('\nΠοσοστά κάλυψης προμηθειών ανά προορισμό:')
-        total_satisfaction = 0
-        for d in self.destinations:
-            rate = d.sat_rate() * 100
-            total_satisfaction += rate
-            status = '✓' if rate >= 90 else '!' if rate >= 50 else '✗'
-            print(f'  {status} {d.name:<12}: {rate:5.1f}%')
+        rates  = np.fromiter((d.sat_rate() for d in self.destinations), np.float64) * 100
+        status = STATUS_MARKS[np.digitize(rates, STATUS_BINS)]
+        for (d, mark, rate) in zip(self.destinations, status, rates):
+            print(f'  {mark} {d.name:<12}: {rate:5.1f}%')
         
-        avg_satisfaction = (
-            total_satisfaction / len(self.destinations) if self.destinations else 0
-        )
+        avg_satisfaction = rates.mean() if rates.size else 0
         print(f'\nΜέση κάλυψη: {avg_satisfaction:.1f}%')
 
         return;
@@ -148,17 +202,26 @@ class DroneAnimator:
 
     def _setup_static_elements(self) -> None:
         ''' Ζωγραφική των στατικών στοιχείων της σκηνής. '''
-        # Δεν θέλουμε να έχουμε προβλήματα Out Of Bounds!
-        all_x = [d.x for d in self.depots + self.destinations]
-        all_y = [d.y for d in self.depots + self.destinations]
-        
-        if not all_x or not all_y:
+        # Συντεταγμένες ως πίνακες (n, 2) - υπολογίζονται 1 φορά εδώ!
+        self._depots_xy = np.array(
+            [(d.x, d.y) for d in self.depots], dtype = np.float64
+        ).reshape(-1, 2)
+        self._dests_xy  = np.array(
+            [(d.x, d.y) for d in self.destinations], dtype = np.float64
+        ).reshape(-1, 2)
+        all_xy = np.concatenate([self._depots_xy, self._dests_xy])
+        
+        if not len(all_xy):
             return;
         
-        margin = max(10, (max(all_x) - min(all_x)) * 0.1)
-        self.ax.set_xlim(min(all_x) - margin, max(all_x) + margin)
-        self.ax.set_ylim(min(all_y) - margin, max(all_y) + margin)
+        # Δεν θέλουμε να έχουμε προβλήματα Out Of Bounds!
+        ((min_x, min_y), (max_x, max_y)) = (all_xy.min(axis = 0), all_xy.max(axis = 0))
+        margin = max(10, (max_x - min_x) * 0.1)
+        self.ax.set_xlim(min_x - margin, max_x + margin)
+        self.ax.set_ylim(min_y - margin, max_y + margin)
         self.ax.set_aspect('equal', adjustable = 'box')
+        # Τα όρια είναι πλέον σταθερά - Κανένα autoscale από τα set_offsets του animation!
+        self.ax.set_autoscale_on(False)
         self.ax.grid(alpha = 0.3, linestyle = '--')
         
         # Βάλε τον χάρτη πόλης ως φόντο [εάν υπάρχει]
@@ -168,8 +231,8 @@ class DroneAnimator:
                 self.ax.imshow(
                     bg_img,
                     extent = [
-                        min(all_x) - margin, max(all_x) + margin,
-                        min(all_y) - margin, max(all_y) + margin
+                        min_x - margin, max_x + margin,
+                        min_y - margin, max_y + margin
                     ],
                     origin = 'upper',
                     alpha  = 0.7,
@@ -181,7 +244,7 @@ class DroneAnimator:
         # Σημεία εφοδιασμού
         if self.depots:
             self.ax.scatter(
-                [d.x for d in self.depots], [d.y for d in self.depots],
+                self._depots_xy[:, 0], self._depots_xy[:, 1],
                 marker = 's', s = 200, c = 'tab:cyan', edgecolors = 'navy',
                 label = 'Depots', zorder = 2
             )
@@ -195,8 +258,8 @@ class DroneAnimator:
         
         # Σημεία ανάγκης X [αρχικά όλα κόκκινα]
         if self.destinations:
-            self._dest_scatter = self.ax.scatter(
-                [d.x for d in self.destinations], [d.y for d in self.destinations],
+            self.ax.scatter(
+                self._dests_xy[:, 0], self._dests_xy[:, 1],
                 marker = 'X', s = 150, c = 'red', edgecolors = 'darkred',
                 label = 'Destinations', zorder = 2
             )
@@ -220,6 +283,13 @@ class DroneAnimator:
             linewidths = 2, zorder = 4, label = 'Drones'
         )
         
+        # Σημεία ανάγκης που καλύφθηκαν - Ξεχωριστό scatter [πράσινα X] που
+        # σχεδιάζεται πάνω από το στατικό [κόκκινο] και μεγαλώνει με τις αφίξεις!
+        self._dest_green = self.ax.scatter(
+            [], [], marker = 'X', s = 150, c = 'lightgreen', edgecolors = 'darkred',
+            zorder = 2
+        )
+        
         # Status display
         self.text_status = self.ax.text(
             0.98, 0.02, '', transform = self.ax.transAxes, fontsize = 10,
@@ -259,62 +329,64 @@ class DroneAnimator:
 
     def _build_trajectories(self) -> None:
         ''' Δημιουργία διαδρομών για κάθε δρόνο με βάση τις αναθέσεις. '''
-        depot_by_id = {d.id: d for d in self.depots}
-        dest_by_id  = {d.id: d for d in self.destinations}
-        
-        # Ομαδοποίηση αναθέσεων ανά δρόνο
-        assignments_by_drone = {}
-        for a in self.assignments:
-            assignments_by_drone.setdefault(a.drone_id, []).append(a)
+        # 1ο πέρασμα: Τα segments ΟΛΩΝ των δρόνων [3 ανά ανάθεση] σε κοινές λίστες:
+        # αρχική θέση -> [depot -> dest -> depot] x αναθέσεις
+        (seg_p0, seg_p1, seg_speeds) = ([], [], [])
+        for drone in self.drones:
+            pos = (drone.x, drone.y)
+            for assignment in self._assign_by_drone.get(drone.id, []):
+                depot = self._depot_by_id[assignment.depot_id]
+                dest  = self._dest_by_id[assignment.dest_id]
+                for target in ((depot.x, depot.y), (dest.x, dest.y), (depot.x, depot.y)):
+                    seg_p0.append(pos)
+                    seg_p1.append(target)
+                    seg_speeds.append(drone.speed)
+                    pos = target
+        
+        # Όλα τα segments του στόλου με 1 κλήση!
+        (positions, n_steps) = _interpolate_segments(
+            np.array(seg_p0, dtype = np.float64).reshape(-1, 2),
+            np.array(seg_p1, dtype = np.float64).reshape(-1, 2),
+            np.array(seg_speeds, dtype = np.float64),
+            self.dt
+        )
+        cum_steps = np.cumsum(n_steps)
         
+        # 2ο πέρασμα: Κάθε δρόνος παίρνει το δικό του κομμάτι [slice] των θέσεων
+        first_seg = 0
         for drone in self.drones:
-            assigns = assignments_by_drone.get(drone.id, [])
+            assigns = self._assign_by_drone.get(drone.id, [])
             
             if not assigns:
-                # Δρόνος χωρίς αναθέσεις - idle state
-                idle_frames = max(
-                    100, self.max_frames
-                ) if hasattr(self, 'max_frames') else 100
+                # Δρόνος χωρίς αναθέσεις - idle state: 1 μόνο θέση, που απλώνεται
+                # [broadcast] σε όλα τα frames κατά το πακετάρισμα των θέσεων!
                 self.trajectories[drone.id] = _Trajectory(
-                    [(drone.x, drone.y)] * idle_frames, []
+                    np.array([[drone.x, drone.y]], dtype = np.float64), []
                 )
                 continue;
             
-            pos         = (drone.x, drone.y)
-            frames      = []
+            segs        = slice(first_seg, first_seg + 3 * len(assigns))
+            first_seg  += 3 * len(assigns)
+            frame_start = cum_steps[segs.start - 1] if segs.start else 0
+            frames      = positions[frame_start:cum_steps[segs.stop - 1]]
+            # Frame ολοκλήρωσης κάθε segment [ή το τρέχον, αν το segment είναι κενό]
+            seg_ends = cum_steps[segs] - frame_start - (n_steps[segs] > 0)
+            
             dest_frames = []
-            for assignment in assigns:
-                depot = depot_by_id[assignment.depot_id]
-                dest  = dest_by_id[assignment.dest_id]
-                
-                # Αρχική θέση του δρόνου -> Σημείο εφοδιασμού
-                segment      = _interpolate(pos, (depot.x, depot.y), drone.speed, self.dt)
-                pickup_frame = len(frames) + len(segment) - 1 if segment else len(frames)
+            for (k, assignment) in enumerate(assigns):
+                pickup_frame = int(seg_ends[3*k])
+                drop_frame   = int(seg_ends[3*k + 1])
                 
                 self._events.append(
-                    (pickup_frame, 'pickup', drone.id, depot.id, assignment.supply)
+                    (pickup_frame, 'pickup', drone.id, assignment.depot_id, assignment.supply)
                 )
-                frames.extend(segment)
-                pos = (depot.x, depot.y)
-                
-                # Σημείο εφοδιασμού -> Σημείο ανάγκης
-                segment    = _interpolate(pos, (dest.x, dest.y), drone.speed, self.dt)
-                drop_frame = len(frames) + len(segment) - 1 if segment else len(frames)
-                
                 self._events.append(
-                    (drop_frame, 'drop', drone.id, dest.id, assignment.supply)
+                    (drop_frame, 'drop', drone.id, assignment.dest_id, assignment.supply)
                 )
                 dest_frames.append((assignment.dest_id, drop_frame))
-                frames.extend(segment)
-                pos = (dest.x, dest.y)
-                
-                # Σημείο ανάγκης -> Σημείο εφοδιασμού
-                return_segment = _interpolate(pos, (depot.x, depot.y), drone.speed, self.dt)
-                frames.extend(return_segment)
-                pos = (depot.x, depot.y)
             
-            if not frames: # Μην γίνει πατάτα αν δεν υπάρχουν frames!!!
-                frames = [(drone.x, drone.y)]
+            if not len(frames): # Μην γίνει πατάτα αν δεν υπάρχουν frames!!!
+                frames = np.array([[drone.x, drone.y]], dtype = np.float64)
             
             self.trajectories[drone.id] = _Trajectory(frames, dest_frames)
 
@@ -334,11 +406,10 @@ class DroneAnimator:
         left_info.append('Drones')
         left_info.append('-' * 25)
         
-        for drone in self.drones:
-            cargo = self.drone_cargo[drone.id]
-            status = 'On-Duty' if any(cargo.to_dict().values()) else 'Idle'
+        for (k, drone) in enumerate(self.drones):
+            status = 'On-Duty' if self._in_flight[k] else 'Idle'
             left_info.append(f'{status} Drone {drone.id:2d}')
-            left_info.append(f'   {self._format_supply_info(cargo)}')
+            left_info.append(f'   {self._format_supply_info(self.drone_cargo[drone.id])}')
         
         left_info.append('\nDepots')
         left_info.append('-' * 25)
@@ -354,10 +425,10 @@ class DroneAnimator:
         right_info.append('Destinations')
         right_info.append('-' * 25)
         
-        for (i, dest) in enumerate(self.destinations):
-            rate = dest.sat_rate() * 100
-            status = '✓' if rate >= 90 else '!' if rate >= 50 else '✗'
-            right_info.append(f'{status} {dest.name}')
+        rates  = self._sat_rates * 100
+        status = STATUS_MARKS[np.digitize(rates, STATUS_BINS)] # 1 lookup για όλα
+        for (dest, mark, rate) in zip(self.destinations, status, rates):
+            right_info.append(f'{mark} {dest.name}')
             right_info.append(f'   {rate:5.1f}%')
             right_info.append(f'   {self._format_supply_info(dest.satisfied)}')
         
@@ -368,102 +439,109 @@ class DroneAnimator:
     # --- Animation callbacks ---
     def _init_animation(self) -> tuple:
         self.scat_drones.set_offsets(np.empty((0, 2)))
-        self.text_status.set_text('')
-        self._update_info_panels(0)
+        # Re-init [π.χ. resize]: τα ήδη ικανοποιημένα σημεία μένουν πράσινα!
+        self._dest_green.set_offsets(self._dests_xy[self._dest_satisfied])
+        self._update_status_text(self._frame)
+        self._update_info_panels(self._frame)
         
-        return (
+        # Τα δυναμικά artists ΔΕΝ πρέπει να μπουν στο background του blitting!
+        artists = (
             self.scat_drones,
             self.text_status,
-            self._dest_scatter,
+            self._dest_green,
             self.left_text,
             self.right_text
-        );
+        )
+        for artist in artists:
+            artist.set_animated(True)
+        
+        return artists;
 
     def _update_animation(self, frame: int) -> tuple:
         '''Update animation for current frame with enhanced event handling.'''
         # Επεξεργασία γεγονότων για το τρέχον frame!
-        active_drones = set()
-        
-        for (event_frame, event_type, drone_id, location_id, supply) in self._events:
-            if frame == event_frame:
-                if event_type == 'pickup':
-                    depot = next((d for d in self.depots if d.id == location_id), None)
-                    if depot:
-                        depot.supply               = depot.supply - supply
-                        self.drone_cargo[drone_id] = supply
-                
-                elif event_type == 'drop':
-                    dest = next((d for d in self.destinations if d.id == location_id), None)
-                    if dest:
-                        dest.satisfied             = dest.satisfied + supply
-                        self.drone_cargo[drone_id] = Supply()
-                        self._animation_stats['completed_deliveries'] += 1
-        
-        # Ενημέρωση θέσεων δρόνων
-        positions = []
-        for drone in self.drones:
-            pos = self.trajectories[drone.id].pos_at(frame)
-            positions.append(pos)
+        frame_events = self._events_by_frame.get(frame, [])
+        had_event    = bool(frame_events)
+        self._frame  = frame
+        
+        for (_, event_type, drone_id, location_id, supply) in frame_events:
+            if event_type == 'pickup':
+                depot = self._depot_by_id.get(location_id)
+                if depot:
+                    depot.supply               = depot.supply - supply
+                    self.drone_cargo[drone_id] = supply
+                    self._in_flight[self._drone_index[drone_id]] = supply.total() > 0
             
-            # Έλεγχος αν ο δρόνος έχει ενεργό φορτίο
-            if any(self.drone_cargo[drone.id].to_dict().values()):
-                active_drones.add(drone.id)
-        
-        self.scat_drones.set_offsets(positions)
-        self._animation_stats['drones_in_flight'] = len(active_drones)
+            elif event_type == 'drop':
+                k = self._dest_index.get(location_id)
+                if k is not None:
+                    dest                       = self.destinations[k]
+                    dest.satisfied             = dest.satisfied + supply
+                    self._sat_rates[k]         = dest.sat_rate()
+                    self.drone_cargo[drone_id] = Supply()
+                    self._in_flight[self._drone_index[drone_id]] = False
+                    self._animation_stats['completed_deliveries'] += 1
+        
+        # Ενημέρωση θέσεων δρόνων [1 slice του πυκνού πίνακα θέσεων]
+        self.scat_drones.set_offsets(self._positions[frame])
+        
+        if had_event: # Το φορτίο των δρόνων αλλάζει ΜΟΝΟ σε γεγονότα
+            self._animation_stats['drones_in_flight'] = int(np.count_nonzero(self._in_flight))
         
         self._update_destination_colors(frame) # Ενημέρωση χρωμάτων σημείων ανάγκης
         
         # Ενημέρωση κατάστασης
-        status_text = (
-            f'Frame: {frame:4d}/{self.max_frames-1:4d}\n'
-
-            f"Deliveries: {self._animation_stats[
-                'completed_deliveries'
-            ]:2d}/{self._animation_stats['total_deliveries']:2d}\n"
-
-            f"On-Duty Drones: {self._animation_stats['drones_in_flight']:2d}"
-        )
-        self.text_status.set_text(status_text)
+        if had_event or (frame % self._text_interval == 0) or (frame == self.max_frames - 1):
+            self._update_status_text(frame)
         
-        self._update_info_panels(frame) # Ενημέρωση πληροφοριών στους πίνακες
+        # Οι πίνακες πληροφοριών αλλάζουν ΜΟΝΟ σε pickup/drop - Επιστρέφονται όμως σε κάθε
+        # frame, αφού το FuncAnimation σβήνει (restore background) τους άξονες του
+        # προηγούμενου frame και θα χάνονταν από την οθόνη!
+        if had_event:
+            self._update_info_panels(frame)
         
         return (
             self.scat_drones,
             self.text_status,
-            self._dest_scatter,
+            self._dest_green,
             self.left_text,
             self.right_text
         );
 
+    def _update_status_text(self, frame: int) -> None:
+        ''' Ενημέρωση του status display [frame, παραδόσεις, ενεργοί δρόνοι]. '''
+        stats       = self._animation_stats
+        status_text = (
+            f'Frame: {frame:4d}/{self.max_frames-1:4d}\n'
+            f"Deliveries: {stats['completed_deliveries']:2d}/{stats['total_deliveries']:2d}\n"
+            f"On-Duty Drones: {stats['drones_in_flight']:2d}"
+        )
+        self.text_status.set_text(status_text)
+
+        return;
+
     def _update_destination_colors(self, frame: int) -> None:
         ''' Ενημέρωση χρωμάτων των σημείων ανάγκης ανάλογα με την κατάσταση ολοκλήρωσης. '''
-        colors = []
-        for (i, dest) in enumerate(self.destinations):
-            if self._dest_satisfied[i]:
-                colors.append('lightgreen')
-            else:
-                # Έλεγχος αν έχει ολοκληρωθεί παράδοση για το σημείο ανάγκης
-                for traj in self.trajectories.values():
-                    for (dest_id, completion_frame) in traj.dest_frames:
-                        if (dest_id == dest.id) and (frame >= completion_frame):
-                            colors.append('lightgreen')
-                            self._dest_satisfied[i] = True
-                            break;
-                    else:
-                        continue;
-                    break;
-                else:
-                    colors.append('red')
-        
-        if colors: self._dest_scatter.set_facecolors(colors)
+        # Νέα 'πράσινα' σημεία: όσες μεταβάσεις έχουν frame <= του τρέχοντος
+        changed = False
+        while (self._dest_cursor < len(self._dest_events) and
+               self._dest_events[self._dest_cursor][0] <= frame):
+            self._dest_satisfied[self._dest_events[self._dest_cursor][1]] = True
+            self._dest_cursor += 1
+            changed            = True
+        
+        if changed:
+            self._dest_green.set_offsets(self._dests_xy[self._dest_satisfied])
 
         return;
 
     def run(self) -> FuncAnimation:
+        # cache_frame_data = False: Δεν κρατάμε αναφορές για κάθε frame στη μνήμη
+        # [δεν κάνουμε replay/save, άρα η μνήμη μένει σταθερή όσο κι αν κρατήσει]!
         anim = FuncAnimation(
             self.fig, self._update_animation, frames = self.max_frames,
-            init_func = self._init_animation, interval = 50, blit = True, repeat = False
+            init_func = self._init_animation, interval = 50, blit = True, repeat = False,
+            cache_frame_data = False
         )
 
         # Maximize window - Δεν δουλεύει σε όλα τα PC!!!
@@ -490,33 +568,22 @@ class DroneAnimator:
         self._setup_figure()
         self._setup_static_elements()
         
-        # Για γρήγορη πρόσβαση στα depots και destinations
-        depot_by_id = {d.id: d for d in self.depots}
-        dest_by_id  = {d.id: d for d in self.destinations}
-        
         # Κάποια χρωματάκια για τις διαδρομές
         colors = [
             'cyan', 'yellow', 'lime', 'orange', 'pink', 'lightblue', 'red', 'green'
         ]
         
-        # Oμαδοποίηση αναθέσεων ανά δρόνο
-        drone_routes = {}
-        for assignment in self.assignments:
-            if assignment.drone_id not in drone_routes:
-                drone_routes[assignment.drone_id] = []
-            drone_routes[assignment.drone_id].append(assignment)
-        
         # Σχεδίαση διαδρομών για κάθε δρόνο
-        for drone_id, assignments in drone_routes.items():
-            drone = next(d for d in self.drones if d.id == drone_id)
+        for drone_id, assignments in self._assign_by_drone.items():
+            drone = self._drone_by_id[drone_id]
             color = colors[drone_id % len(colors)]
             
             # Δημιουργία ολοκληρωμένης διαδρομής:
             # σημείο εφοδιασμού -> σημείο ανάγκης -> πίσω στο σημείο εφοδιασμού
             (route_x, route_y) = ([drone.x], [drone.y])
             for assignment in assignments:
-                depot = depot_by_id[assignment.depot_id]
-                dest  = dest_by_id[assignment.dest_id]
+                depot = self._depot_by_id[assignment.depot_id]
+                dest  = self._dest_by_id[assignment.dest_id]
                 
                 # Προσθήκη διαδρομής
                 route_x.extend([depot.x, dest.x, depot.x])
@@ -567,9 +634,10 @@ class _Trajectory:
     ''' Βοηθητική κλάση για την αποθήκευση της/των διαδρομής/ών ενός δρόνου. '''
     
     def __init__(self,
-                 positions:   List[Tuple[float, float]],
+                 positions:   np.ndarray,
                  dest_frames: List[Tuple[int, int]]) -> None:
-        self.positions   = positions if positions else [(0, 0)]
+        # Πίνακας (n_frames, 2) με τις θέσεις του δρόνου ανά frame
+        self.positions   = positions if len(positions) else np.zeros((1, 2))
         self.dest_frames = dest_frames or [] # Λίστα από (dest_id, arrival_frame)
 
         return;
@@ -577,38 +645,32 @@ class _Trajectory:
     @property
     def n_frames(self) -> int:
         return len(self.positions);
-    
-    def pos_at(self, frame: int) -> Tuple[float, float]:
-        ''' Επιστρέφει τη θέση του δρόνου σε συγκεκριμένο frame. '''
-        if not self.positions:
-            return (0, 0);
-        
-        idx = max(0, min(frame, self.n_frames - 1))
-
-        return self.positions[idx];
 
 
 
-def _interpolate(
-    p0: Tuple[float, float], p1: Tuple[float, float], speed: float, dt: float
-) -> List[Tuple[float, float]]:
-    ''' Evenly spaced points από το p0 στο p1 με δεδομένο speed ανά dt. '''
-    if not p0 or not p1 or speed <= 0 or dt <= 0:
-        return [];
+def _interpolate_segments(
+    p0: np.ndarray, p1: np.ndarray, speeds: np.ndarray, dt: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    ''' Evenly spaced points για ΠΟΛΛΑ segments p0[i] -> p1[i] μαζί, με ταχύτητα speeds[i]
+    ανά dt. Επιστρέφει (θέσεις (n, 2) στη σειρά των segments, πλήθος βημάτων ανά segment). '''
+    if not len(p0) or dt <= 0:
+        return (np.empty((0, 2)), np.zeros(len(p0), dtype = np.int64));
     
-    vec  = np.array(p1) - np.array(p0)
-    dist = np.linalg.norm(vec)
+    vecs  = p1 - p0
+    dists = np.hypot(vecs[:, 0], vecs[:, 1])
     
-    if dist < 1e-6: # Πολύ μικρή απόσταση
-        return [];
+    # Πολύ μικρές αποστάσεις [ή μη θετική ταχύτητα] -> 0 βήματα, αλλιώς τουλάχιστον 1
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        n_steps = np.where(
+            (dists < 1e-6) | (speeds <= 0), 0, np.maximum(1, np.ceil(dists / (speeds * dt)))
+        ).astype(np.int64)
+    step_vecs = vecs / np.maximum(n_steps, 1)[:, None] # Βήμα ανά frame
     
-    n_steps   = max(1, math.ceil(dist / (speed * dt)))
-    step_size = dist / n_steps
-    direction = vec / dist
+    # Για κάθε σημείο: σε ποιο segment ανήκει & ποιο βήμα (1, 2, ..., n) είναι
+    seg  = np.repeat(np.arange(len(p0)), n_steps)
+    step = np.arange(1, len(seg) + 1) - np.repeat(np.cumsum(n_steps) - n_steps, n_steps)
     
-    return [
-        tuple(np.array(p0) + direction * step_size * i) for i in range(1, n_steps + 1)
-    ];
+    return (step[:, None] * step_vecs[seg] + p0[seg], n_steps);
 
 
 
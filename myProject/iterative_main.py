@@ -3,9 +3,9 @@
 from scenario import big_city_scenario, silent_hill_scenario
 from models import Supply, Depot, Destination, Drone
 from typing import List, Dict, Tuple
-from lp_solver import solve
+from lp_solver import solve, ModelCache
 from time import time
-import copy
+import numpy as np
 
 def update_supplies_after_assignments(depots:      List[Depot],
                                       assignments: List) -> None:
@@ -32,7 +32,7 @@ def create_unsatisfied_destinations_with_mapping(
         remaining_demand = dest.demand - dest.satisfied
         if remaining_demand.total() > 0:
             # Δημιουργούμε νέο προορισμό με την υπολειπόμενη ζήτηση
-            new_dest           = copy.deepcopy(dest)
+            new_dest           = dest.clone()
             new_dest.id        = new_id # Νέο sequential ID
             new_dest.demand    = remaining_demand
             new_dest.satisfied = Supply() # Reset για την επόμενη επανάληψη
@@ -43,14 +43,6 @@ def create_unsatisfied_destinations_with_mapping(
     
     return (unsatisfied, id_mapping);
 
-def has_available_supplies(depots: List[Depot]) -> bool:
-    '''Ελέγχει αν υπάρχουν ακόμη διαθέσιμες προμήθειες στα depots'''
-    for depot in depots:
-        if depot.supply.total() > 0:
-            return True;
-
-    return False;
-
 def reset_drone_status(drones: List[Drone]) -> None:
     '''Επαναφέρει όλους τους δρόνους σε κατάσταση IDLE'''
     from models import DroneStatus
@@ -64,13 +56,14 @@ def print_iteration_summary(iteration:      int,
                             original_dests: List[Destination], 
                             id_mapping:     Dict[int, int]) -> None:
     '''Εκτυπώνει περίληψη της επανάληψης'''
-    print(f'\n=== ΕΠΑΝΑΛΗΨΗ {iteration} ===')
+    lines = [f'\n=== ΕΠΑΝΑΛΗΨΗ {iteration} ===']
     
     if not assignments:
-        print('Δεν βρέθηκαν εφικτές αναθέσεις σε αυτή την επανάληψη.')
+        lines.append('Δεν βρέθηκαν εφικτές αναθέσεις σε αυτή την επανάληψη.')
+        print('\n'.join(lines))
         return;
     
-    print(f'Αναθέσεις αποστολών (Επανάληψη {iteration}):')
+    lines.append(f'Αναθέσεις αποστολών (Επανάληψη {iteration}):')
     for a in assignments:
         # Χρησιμοποιούμε το mapping για να βρούμε το σωστό όνομα
         original_dest_id = id_mapping.get(a.dest_id, a.dest_id)
@@ -80,12 +73,14 @@ def print_iteration_summary(iteration:      int,
             dest_name = f'Dest_{original_dest_id}'
             
         cargo = a.supply.to_dict()
-        print(
+        lines.append(
             f'  Δρόνος {a.drone_id} -> {dest_name:<15} | Απόσταση: {a.distance:5.1f} '
             f"| Φορτίο: {cargo['food']:>3} τρόφιμα, {cargo['water']:>3} νερό, "
             f"{cargo['medicine']:>3} φάρμακα"
         )
     
+    print('\n'.join(lines)) # 1 εγγραφή στο stdout αντί για 1 ανά γραμμή
+    
     return;
 
 def print_final_summary(all_assignments: List,
@@ -93,13 +88,14 @@ def print_final_summary(all_assignments: List,
                         total_time:      float,
                         iterations:      int) -> None:
     '''Εκτυπώνει τελική περίληψη όλων των επαναλήψεων'''
-    print(f'\n{"="*80}')
-    print(f'- ΤΕΛΙΚΗ ΠΕΡΙΛΗΨΗ - {iterations} Επαναλήψεις')
-    print(f'{"="*80}')
-    print(f'Συνολικός χρόνος επίλυσης: {total_time:.2f} sec')
-    print(f'Συνολικές αναθέσεις:       {len(all_assignments)}')
-    
-    print('\nΌλες οι αναθέσεις αποστολών:')
+    lines = [
+        f'\n{"="*80}',
+        f'- ΤΕΛΙΚΗ ΠΕΡΙΛΗΨΗ - {iterations} Επαναλήψεις',
+        f'{"="*80}',
+        f'Συνολικός χρόνος επίλυσης: {total_time:.2f} sec',
+        f'Συνολικές αναθέσεις:       {len(all_assignments)}',
+        '\nΌλες οι αναθέσεις αποστολών:'
+    ]
     for (i, a) in enumerate(all_assignments, 1):
         if a.dest_id < len(original_dests):
             dest_name = original_dests[a.dest_id].name
@@ -107,17 +103,19 @@ def print_final_summary(all_assignments: List,
             dest_name = f'Dest_{a.dest_id}'
             
         cargo = a.supply.to_dict()
-        print(
+        lines.append(
             f'{i:2}. Δρόνος {a.drone_id} -> {dest_name:<15} | Απόσταση: {a.distance:5.1f} '
             f"| Φορτίο: {cargo['food']:>3} τρόφιμα, {cargo['water']:>3} νερό, "
             f"{cargo['medicine']:>3} φάρμακα"
         )
 
-    print('\nΤελικά ποσοστά κάλυψης προμηθειών ανά προορισμό:')
+    lines.append('\nΤελικά ποσοστά κάλυψης προμηθειών ανά προορισμό:')
     for d in original_dests:
         satisfaction_rate = d.sat_rate() * 100
         status = '[✓] ΠΛΗΡΩΣ' if satisfaction_rate >= 99.9 else '[!] ΜΕΡΙΚΩΣ' if satisfaction_rate > 0 else '[✗] ΚΑΘΟΛΟΥ'
-        print(f'  {d.name:<12}: {satisfaction_rate:5.1f}% {status}')
+        lines.append(f'  {d.name:<12}: {satisfaction_rate:5.1f}% {status}')
+
+    print('\n'.join(lines)) # 1 εγγραφή στο stdout αντί για 1 ανά γραμμή
 
     return;
 
@@ -136,13 +134,14 @@ def main():
     (drones, depots, dests) = big_city_scenario()
     
     # Δημιουργία αντιγράφων για επεξεργασία
-    working_depots = copy.deepcopy(depots)
-    working_dests  = copy.deepcopy(dests)
-    original_dests = copy.deepcopy(dests) # Κρατάμε τα πρωτότυπα για τελική αναφορά
+    working_depots = [d.clone() for d in depots]
+    working_dests  = [d.clone() for d in dests]
+    original_dests = [d.clone() for d in dests] # Κρατάμε τα πρωτότυπα για τελική αναφορά
     
     all_assignments = []
     iteration       = 1
     max_iterations  = 10 # Μέγιστος αριθμός επαναλήψεων
+    model_cache     = ModelCache() # Επαναχρησιμοποίηση μοντέλου μεταξύ επαναλήψεων
     
     print('\nΕΝΑΡΞΗ ΕΠΑΝΑΛΗΠΤΙΚΗΣ ΕΠΙΛΥΣΗΣ')
     print('=' * 60)
@@ -165,19 +164,21 @@ def main():
             break;
         
         # Ελέγχουμε αν υπάρχουν ακόμη διαθέσιμες προμήθειες
-        if not has_available_supplies(working_depots):
+        # [1 άθροισμα ανά επανάληψη - χρησιμοποιείται και στην εκτύπωση]
+        available = sum(d.supply.total() for d in working_depots)
+        if available == 0:
             print('Δεν υπάρχουν άλλες διαθέσιμες προμήθειες στα depots.')
             break;
         
         print(f'Μη ικανοποιημένοι προορισμοί: {len(unsatisfied_dests)}')
-        print(f'Διαθέσιμες προμήθειες:        {sum(d.supply.total() for d in working_depots)}')
+        print(f'Διαθέσιμες προμήθειες:        {available}')
         
         reset_drone_status(drones) # Επαναφορά κατάστασης δρόνων σε IDLE
         
         try:
             # Επίλυση για την τρέχουσα επανάληψη
             iteration_start = time()
-            assignments     = solve(drones, working_depots, unsatisfied_dests)
+            assignments     = solve(drones, working_depots, unsatisfied_dests, model_cache)
             iteration_time  = time() - iteration_start
             
             print(f'Χρόνος επανάληψης {iteration}:          {iteration_time:.2f} sec')
@@ -203,7 +204,7 @@ def main():
                         success_count += 1
                     
                     # Δημιουργία διορθωμένης ανάθεσης για την τελική λίστα
-                    corrected_assignment         = copy.deepcopy(assignment)
+                    corrected_assignment         = assignment.clone()
                     corrected_assignment.dest_id = original_dest_id
                     all_assignments.append(corrected_assignment)
                 else:
@@ -236,9 +237,11 @@ def main():
     
     # Στατιστικά
     print(f'\nΣΤΑΤΙΣΤΙΚΑ:')
-    fully_satisfied     = sum(1 for d in original_dests if d.sat_rate() >= 0.999)
-    partially_satisfied = sum(1 for d in original_dests if 0 < d.sat_rate() < 0.999)
-    unsatisfied         = sum(1 for d in original_dests if d.sat_rate() == 0)
+    # Ποσοστά κάλυψης σε 1 πίνακα [1 πέρασμα] => Μετρήσεις με μάσκες
+    rates               = np.fromiter((d.sat_rate() for d in original_dests), np.float64)
+    fully_satisfied     = int(np.count_nonzero(rates >= 0.999))
+    partially_satisfied = int(np.count_nonzero((rates > 0) & (rates < 0.999)))
+    unsatisfied         = int(np.count_nonzero(rates == 0))
     
     print(f'  Πλήρως ικανοποιημένοι προορισμοί:  {fully_satisfied}/{len(original_dests)}')
     print(f'  Μερικώς ικανοποιημένοι προορισμοί: {partially_satisfied}/{len(original_dests)}')
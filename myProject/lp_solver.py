@@ -1,7 +1,10 @@
 # lp_solver.py
 
 from models import Drone, Depot, Destination, Supply, Priority, Assignment
-from typing import List
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import List, Tuple
+import numpy as np
 import pulp
 
 # Global Μεταβλητές
@@ -11,112 +14,314 @@ supply_types = ['food', 'water', 'medicine']
 # Δεν έχει καμία σχέση με τα .value του Enum (HIGH=1, MEDIUM=2, LOW=3).
 priority_w = {Priority.HIGH: 3., Priority.MEDIUM: 2., Priority.LOW: 1.}
 
-BIG_M = 10_000
+def to_arrays(drones: List[Drone],
+              depots: List[Depot],
+              dests:  List[Destination]) -> dict:
+    ''' Struct-of-arrays αντίγραφο των πεδίων που χρειάζεται το μοντέλο [1 πέρασμα
+    πάνω στα dataclasses, μετά μόνο NumPy] '''
+    # Οι ποσότητες είναι το πολύ μερικές χιλιάδες => int32 αρκεί. Οι συντεταγμένες
+    # μένουν float64, ώστε ο έλεγχος εμβέλειας να συμφωνεί με το Drone.can_reach!
+    return {
+        'depot_xy': np.array([(i.x, i.y) for i in depots], dtype = np.float64).reshape(-1, 2),
+        'dest_xy':  np.array([(j.x, j.y) for j in dests],  dtype = np.float64).reshape(-1, 2),
+        'supply':   np.array([i.supply.as_tuple() for i in depots], dtype = np.int32).reshape(-1, 3),
+        'demand':   np.array([j.demand.as_tuple() for j in dests],  dtype = np.int32).reshape(-1, 3),
+        'weight':   np.array([priority_w[j.priority] for j in dests], dtype = np.float64),
+        'capacity': np.array([d.capacity for d in drones], dtype = np.int32),
+        'range':    np.array([d.range for d in drones],    dtype = np.float64)
+    };
+
+def distance_matrix(depots: List[Depot] | np.ndarray,
+                    dests:  List[Destination] | np.ndarray) -> np.ndarray:
+    ''' Πίνακας Ευκλείδειων αποστάσεων (depots x dests) με 1 πέρασμα [broadcasting] '''
+    if not isinstance(depots, np.ndarray): # Λίστα από dataclasses => πίνακας (n, 2)
+        depots = np.array([(i.x, i.y) for i in depots], dtype = np.float64).reshape(-1, 2)
+    if not isinstance(dests, np.ndarray):
+        dests  = np.array([(j.x, j.y) for j in dests],  dtype = np.float64).reshape(-1, 2)
+    diff = depots[:, None, :] - dests[None, :, :]
+
+    return np.hypot(diff[..., 0], diff[..., 1]);
 
 def build_model(drones:        List[Drone],
                 depots:        List[Depot],
                 dests:         List[Destination],
-                UNMET_PENALTY: int = 1_000) -> tuple:
+                UNMET_PENALTY: int        = 1_000,
+                dist:          np.ndarray = None,
+                arrays:        dict       = None) -> tuple:
     ''' Δημιουργία/Ορισμός του μαθηματικού μοντέλου [MILP] για το πρόβλημα '''
     model = pulp.LpProblem('DroneDelivery', pulp.LpMinimize) # Πρόβλημα ελαχιστοποίησης
 
+    if arrays is None:
+        arrays = to_arrays(drones, depots, dests)
+    if dist is None:
+        dist = distance_matrix(arrays['depot_xy'], arrays['dest_xy'])
+
+    # Πίνακες προσφοράς (depots x supply) & ζήτησης (dests x supply)
+    (supply, demand) = (arrays['supply'], arrays['demand'])
+    # useful[i, j, s]: Η αποθήκη i έχει το είδος s ΚΑΙ ο προορισμός j το χρειάζεται
+    useful = (supply[:, None, :] > 0) & (demand[None, :, :] > 0)
+
     # Δημιουργία τριπλέτων (drone_id, depot_id, destination_id) ΜΟΝΟ αν ο δρόνος
     # μπορεί να φτάσει στον προορισμό και να επιστρέψει [βάσει εμβέλειας]!
-    routes = [
-        (d.id, i.id, j.id) for d in drones for i in depots for j in dests 
-        if d.can_reach(i, j)
+    # -> Μάσκα reach[drone, depot, dest] για όλους τους συνδυασμούς μαζί
+    reach  = dist[None, :, :] * 2 <= arrays['range'][:, None, None]
+    # Routes που δεν μπορούν να μεταφέρουν τίποτα χρήσιμο απορρίπτονται εξαρχής
+    reach &= useful.any(axis = 2)[None, :, :]
+    (ks, is_, js) = np.nonzero(reach)
+    routes        = [
+        (drones[k].id, depots[i].id, dests[j].id) for (k, i, j) in zip(ks, is_, js)
     ]
+    # --- Κατασκευή κατά στήλες ---
+    # Κάθε μεταβλητή καταχωρεί τον συντελεστή της στις γραμμές (περιορισμούς) όπου
+    # συμμετέχει τη στιγμή που δημιουργείται => Κάθε γραμμή χτίζεται 1 φορά στο τέλος,
+    # χωρίς ενδιάμεσα lpSum / += πάνω σε λίστες Python.
+    obj_terms   = []
+    drone_rows  = {d.id: [] for d in drones}                                # Χωρητικότητα
+    supply_rows = {(i.id, s): [] for i in depots for s in supply_types}     # Προμήθεια
+    demand_rows = {(j.id, s): [] for j in dests  for s in supply_types}     # Ζήτηση
+    route_rows  = {r: [] for r in routes}                                   # Σύνδεση x - y
+
+    # Κόστος ανά route [απόσταση x προτεραιότητα] & ποινή unmet ανά προορισμό - 1 φορά
+    capacity  = arrays['capacity']
+    route_c   = dist * arrays['weight'][None, :]
+    unmet_pen = UNMET_PENALTY * arrays['weight']
+    # Οι συντελεστές ανά route με 1 gather πάνω στους δείκτες των routes:
+    # κόστος [απόσταση x προτεραιότητα] & "Big-M" της σύνδεσης x - y
+    cost_c = route_c[is_, js].tolist()
+    link_c = (-np.minimum(capacity[ks], demand.sum(axis = 1)[js])).tolist()
+
     # Δυαδική ανάθεση αποστολής σε δρόνο - Μεταβλητή y
-    y = {r: pulp.LpVariable(f'y_{r[0]}_{r[1]}_{r[2]}', cat = 'Binary') for r in routes}
     # Ποσότητα προμηθειών που μεταφέρεται βάση συγκεκριμένης αποστολής - Μεταβλητή x
-    x = {
-        (d, i, j, s): pulp.LpVariable(f'x_{s}_{d}_{i}_{j}', lowBound = 0)
-        for (d, i, j) in routes for s in supply_types
-    }
+    # [μόνο για τα είδη που υπάρχουν στην αποθήκη και ζητά ο προορισμός]
+    (y, x) = ({}, {})
+    for ((d, i, j), c, m) in zip(routes, cost_c, link_c):
+        var        = pulp.LpVariable(f'y_{d}_{i}_{j}', cat = 'Binary')
+        y[d, i, j] = var
+        # Κόστος ανάθεσης: απόσταση x προτεραιότητα
+        obj_terms.append((var, c))
+        # Σύνδεση x - y ανά route [αντί για Big-M ανά είδος προμήθειας]
+        # - Θέλουμε: Να επιτρέπεται μη μηδενική ποσότητα x[...] μόνο όταν y = 1!
+        # Το φορτίο ενός route δεν μπορεί να ξεπεράσει ούτε τη χωρητικότητα του
+        # δρόνου, ούτε τη συνολική ζήτηση του προορισμού => min(...) ως "Big-M"
+        route_rows[d, i, j].append((var, m))
+
+        for (k, s) in enumerate(supply_types):
+            if not useful[i, j, k]:
+                continue;
+
+            var           = pulp.LpVariable(f'x_{s}_{d}_{i}_{j}', lowBound = 0)
+            x[d, i, j, s] = var
+            drone_rows[d].append((var, 1))
+            supply_rows[i, s].append((var, 1))
+            demand_rows[j, s].append((var, 1))
+            route_rows[d, i, j].append((var, 1))
+
     # Ποσότητα προμηθειών που δεν καλύπτεται από τις αποστολές - Slack Var unmet
-    unmet = {
-        (j.id, s): pulp.LpVariable(f'unmet_{s}_{j.id}', lowBound = 0)
-        for j in dests for s in supply_types
-    }
+    # [μόνο για τα είδη που ζητά ο προορισμός - αλλιώς είναι πάντα 0]
+    unmet = {}
+    for j in dests:
+        for (k, s) in enumerate(supply_types):
+            if demand[j.id, k] == 0:
+                continue;
+
+            var            = pulp.LpVariable(f'unmet_{s}_{j.id}', lowBound = 0)
+            unmet[j.id, s] = var
+            obj_terms.append((var, unmet_pen[j.id]))
+            demand_rows[j.id, s].append((var, 1))
 
     # --- Αντικειμενική συνάρτηση ---
     ''' -> Ο στόχος μας:
     Ελαχιστοποίηση του μεταφορικού κόστους (απόσταση x προτεραιότητα x ανάθεση),
     με ποινή φυσικά για unmet demand! '''
-    model += (
-        pulp.lpSum(
-            depots[i].dist(dests[j]) * priority_w[dests[j].priority] * y[d, i, j]
-            for (d, i, j) in routes
-        ) +
-        pulp.lpSum(
-            UNMET_PENALTY * priority_w[j.priority] * unmet[j.id, s]
-            for j in dests for s in supply_types
-        )
-    )
+    model.setObjective(pulp.LpAffineExpression(obj_terms))
 
     # --- Οι περιορισμοί ---
+    # Οι γραμμές που εξαρτώνται από ποσότητες έχουν όνομα => update_model(...)
+    def add_row(terms: list, sense: int, rhs: float, name: str = None) -> None:
+        if not terms: # Κενή γραμμή [π.χ. μηδενική προμήθεια/ζήτηση] => Πάντα ισχύει
+            return;
+        model.addConstraint(
+            pulp.LpConstraint(pulp.LpAffineExpression(terms), sense, rhs = rhs), name
+        )
 
     # Χωρητικότητα δρόνου - περιορίζουμε το συνολικό
     # φορτίο ανά δρόνο [λόγω πολλαπλών αποστολών]!
     for d in drones:
-        model += (
-            pulp.lpSum(
-                x[d.id, i, j, s] for (drone_id, i, j) in routes if drone_id == d.id
-                for s in supply_types
-            ) <= d.capacity
-        )
+        add_row(drone_rows[d.id], pulp.LpConstraintLE, capacity[d.id])
 
     # Διαθέσιμη προμήθεια στα σημεία εφοδιασμού
     for i in depots:
-        for s in supply_types:
-            model += (
-                pulp.lpSum(
-                    x[d, i.id, j, s] for (d, dep, j) in routes if dep == i.id
-                ) <= getattr(i.supply, s)
-            )
+        for (k, s) in enumerate(supply_types):
+            add_row(supply_rows[i.id, s], pulp.LpConstraintLE, supply[i.id, k], f'supply_{i.id}_{s}')
 
     # Ισορροπία ζήτησης σε κάθε σημείο ανάγκης
     for j in dests:
-        for s in supply_types:
-            delivered = pulp.lpSum(x[d, i, j.id, s] for (d, i, dj) in routes if dj == j.id)
-            model    += delivered + unmet[j.id, s] == getattr(j.demand, s)
+        for (k, s) in enumerate(supply_types):
+            add_row(demand_rows[j.id, s], pulp.LpConstraintEQ, demand[j.id, k], f'demand_{j.id}_{s}')
 
-    # Big‑M
+    # Σύνδεση x - y ανά route
     for (d, i, j) in routes:
-        for s in supply_types:
-            # - Θέλουμε: Να επιτρέπεται μη μηδενική ποσότητα x[...] μόνο
-            # όταν y = 1! Επομένως, καταφεύγουμε σε Big-M τεχνική!
-            model += x[d, i, j, s] <= BIG_M * y[d, i, j]
-            # Δηλαδή, αν και μόνο αν χρησιμοποιείται ένα route,
-            # τότε να επιτρέπεται να σταλούν προμήθειες σε αυτό.
+        add_row(route_rows[d, i, j], pulp.LpConstraintLE, 0, f'link_{d}_{i}_{j}')
+
+    # Σπάσιμο συμμετρίας: Δρόνοι με ίδια (χωρητικότητα, εμβέλεια) είναι ισοδύναμοι
+    # για το μοντέλο => Επιβάλλουμε φθίνον φορτίο μέσα σε κάθε τέτοια ομάδα
+    groups = {}
+    for d in drones:
+        groups.setdefault((d.capacity, d.range), []).append(d.id)
+    for ids in groups.values():
+        for (a, b) in zip(ids, ids[1:]):
+            terms = drone_rows[a] + [(var, -1) for (var, _) in drone_rows[b]]
+            add_row(terms, pulp.LpConstraintGE, 0)
 
     return (model, y, x, unmet);
 
+def model_key(drones: List[Drone],
+              depots: List[Depot],
+              dests:  List[Destination],
+              arrays: dict,
+              dist:   np.ndarray) -> tuple:
+    ''' "Τοπολογία" του μοντέλου: Ό,τι καθορίζει μεταβλητές, γραμμές & αντικειμενική.
+    Αν αλλάξουν μόνο οι ποσότητες [προμήθεια/ζήτηση], το κλειδί μένει ίδιο! '''
+    # Τα ids δίνουν τα ονόματα των μεταβλητών & γραμμών => Μέρος του κλειδιού
+    ids   = tuple(tuple(o.id for o in objs) for objs in (drones, depots, dests))
+    parts = (
+        dist, arrays['weight'], arrays['capacity'], arrays['range'],
+        arrays['supply'] > 0, arrays['demand'] > 0
+    )
+
+    return (ids, *((a.shape, a.tobytes()) for a in parts));
+
+def update_model(model:  pulp.LpProblem,
+                 y:      dict,
+                 arrays: dict) -> None:
+    ''' Ενημέρωση [in-place] των RHS & των "Big-M" ενός ήδη χτισμένου μοντέλου '''
+    (supply, demand, capacity) = (arrays['supply'], arrays['demand'], arrays['capacity'])
+    rows                       = model.constraints
+
+    for (k, s) in enumerate(supply_types):
+        for i in range(len(supply)):
+            if f'supply_{i}_{s}' in rows:
+                rows[f'supply_{i}_{s}'].changeRHS(supply[i, k])
+        for j in range(len(demand)):
+            if f'demand_{j}_{s}' in rows:
+                rows[f'demand_{j}_{s}'].changeRHS(demand[j, k])
+
+    for ((d, i, j), var) in y.items():
+        rows[f'link_{d}_{i}_{j}'].expr[var] = -min(capacity[d], demand[j].sum())
+
+    return;
+
+@dataclass(slots = True)
+class ModelCache:
+    ''' Cache 1 θέσης για διαδοχικά solve(...) [μοντέλο & πίνακας αποστάσεων]. Ανήκει
+    στον καλούντα: Κάθε νήμα/διεργασία πρέπει να έχει το δικό του αντικείμενο! '''
+    dist_key:  tuple          = None # Συντεταγμένες του dist
+    dist:      np.ndarray     = None
+    model_key: tuple          = None # model_key(...) του model
+    model:     pulp.LpProblem = None
+    y:         dict           = None
+    x:         dict           = None
+
+    def distance_matrix(self, arrays: dict) -> np.ndarray:
+        ''' distance_matrix(...) με cache - Μεταξύ διαδοχικών επιλύσεων αλλάζουν
+        συνήθως μόνο οι ποσότητες, όχι οι συντεταγμένες '''
+        (depots_xy, dests_xy) = (arrays['depot_xy'], arrays['dest_xy'])
+        key                   = (depots_xy.shape, depots_xy.tobytes(), dests_xy.shape, dests_xy.tobytes())
+        if self.dist_key != key:
+            self.dist = distance_matrix(depots_xy, dests_xy)
+            self.dist.setflags(write = False) # Κοινόχρηστος => Μόνο για ανάγνωση!
+            self.dist_key = key
+
+        return self.dist;
+
+def get_solver(warm_start: bool = False) -> pulp.LpSolver:
+    ''' Επιλογή solver: HiGHS [in-process μέσω highspy ή CLI] αν είναι διαθέσιμος,
+    αλλιώς ο CBC που έρχεται μαζί με το Pulp '''
+    # Δεν μου αρέσει να εμφανίζει τις πληροφορίες από τον solver => msg = 0
+    # gapRel = 0 => Απόδειξη βελτιστότητας, όπως κάνει και ο CBC
+    # warmStart => Οι τρέχουσες τιμές των μεταβλητών δίνονται ως αρχική λύση
+    # [το in-process HiGHS του Pulp δεν το υποστηρίζει, οπότε απλώς το αγνοεί]
+    for solver in (pulp.HiGHS(msg = 0, gapRel = 0),
+                   pulp.HiGHS_CMD(msg = 0, gapRel = 0, warmStart = warm_start)):
+        if solver.available():
+            return solver;
+
+    return pulp.PULP_CBC_CMD(msg = 0, warmStart = warm_start);
+
 def solve(drones: List[Drone],
           depots: List[Depot],
-          dests:  List[Destination]) -> List[Assignment]:
-    ''' Λύση του προβλήματος με χρήση του Pulp '''
-    (model, y, x, _) = build_model(drones, depots, dests)
+          dests:  List[Destination],
+          cache:  ModelCache = None) -> List[Assignment]:
+    ''' Λύση του προβλήματος με χρήση του Pulp. Με cache [ModelCache] διαδοχικές
+    κλήσεις ξαναχρησιμοποιούν το μοντέλο, αν δεν έχει αλλάξει η τοπολογία του '''
+    arrays = to_arrays(drones, depots, dests) # 1 φορά για μοντέλο & αναθέσεις
+    # Καμία ζήτηση => Η βέλτιστη λύση είναι προφανώς "καμία αποστολή" - Χωρίς solver!
+    if not arrays['demand'].any():
+        return [];
 
-    # Δεν μου αρέσει να εμφανίζει τις πληροφορίες από τον solver => msg = 0
-    model.solve(pulp.PULP_CBC_CMD(msg = 0)) 
+    if cache is None:
+        dist = distance_matrix(arrays['depot_xy'], arrays['dest_xy'])
+        warm = False
+    else:
+        dist = cache.distance_matrix(arrays)
+        key  = model_key(drones, depots, dests, arrays, dist)
+        # Επανάληψη με ίδια τοπολογία [π.χ. νέα σχεδίαση μετά από ενημέρωση αποθεμάτων]
+        # => Ίδιο μοντέλο με νέα RHS, και η προηγούμενη λύση ως αρχική [warm start]
+        warm = cache.model is not None and cache.model_key == key
+
+    if warm:
+        (model, y, x) = (cache.model, cache.y, cache.x)
+        update_model(model, y, arrays)
+    else:
+        (model, y, x, _) = build_model(drones, depots, dests, dist = dist, arrays = arrays)
+        if cache is not None:
+            (cache.model_key, cache.model, cache.y, cache.x) = (key, model, y, x)
+
+    model.solve(get_solver(warm_start = warm))
 
     if pulp.LpStatus[model.status] != 'Optimal':
         raise RuntimeError('Δεν βρέθηκε βέλτιστη λύση!');
 
     assignments = []
-    for ((d, i, j), var) in y.items():
-        if var.value() > 0.5: # Εφικτή αποστολή
-            sup  = Supply(**{s: int(round(x[d, i, j, s].value())) for s in supply_types})
-            dist = depots[i].dist(dests[j])
+    delivered   = np.zeros_like(arrays['demand']) # (dests x supply)
+    # Ανάγνωση όλων των y με 1 πέρασμα => Μάσκα των εφικτών αποστολών
+    routes = list(y)
+    y_val  = np.fromiter((var.varValue or 0. for var in y.values()), np.float64, len(routes))
+    for k in np.flatnonzero(y_val > 0.5): # Μόνο οι αποστολές που επιλέχθηκαν
+        (d, i, j) = routes[k]
+        load      = [
+            int(round(x[d, i, j, s].varValue)) if (d, i, j, s) in x else 0
+            for s in supply_types
+        ]
+        dist_ij = float(dist[i, j])
 
-            # Όσο πιο σημαντικός ο προορισμός, τόσο ΥΨΗΛΟΤΕΡΟ το κόστος ανά μονάδα
-            cost = dist * priority_w[dests[j].priority]
+        # Όσο πιο σημαντικός ο προορισμός, τόσο ΥΨΗΛΟΤΕΡΟ το κόστος ανά μονάδα
+        cost = dist_ij * float(arrays['weight'][j])
 
-            # Δημιουργία της ανάθεσης
-            assignments.append(Assignment(d, i, j, sup, dist, cost))
+        # Δημιουργία της ανάθεσης
+        assignments.append(Assignment(d, i, j, Supply(*load), dist_ij, cost))
+        delivered[j] += load
+
+    # Ενημέρωση της ποσότητας που καλύφθηκε στους προορισμούς [1 φορά ανά προορισμό]!
+    for j in np.flatnonzero(delivered.any(axis = 1)):
+        dests[j].satisfied = dests[j].satisfied + Supply(*map(int, delivered[j]))
 
-            # Ενημέρωση της ποσότητας που καλύφθηκε στον προορισμό!
-            dests[j].satisfied = dests[j].satisfied + sup
-    
     return assignments;
+
+def _solve_worker(scenario: tuple) -> List[Assignment]:
+    return solve(*scenario);
+
+def solve_many(scenarios:   List[Tuple[List[Drone], List[Depot], List[Destination]]],
+               max_workers: int = None) -> List[List[Assignment]]:
+    ''' Επίλυση πολλών ανεξάρτητων σεναρίων παράλληλα [1 διεργασία ανά σενάριο].
+    Επιστρέφει τις αναθέσεις με τη σειρά των σεναρίων, όπως θα έκανε το solve() '''
+    # Τα σενάρια λύνονται σε αντίγραφα [pickle] => Η κάλυψη των προορισμών
+    # ενημερώνεται εδώ, στα αντικείμενα του καλούντος, όπως στο solve()!
+    with ProcessPoolExecutor(max_workers = max_workers) as pool:
+        results = list(pool.map(_solve_worker, scenarios))
+
+    for ((_, _, dests), assignments) in zip(scenarios, results):
+        for a in assignments:
+            dests[a.dest_id].satisfied = dests[a.dest_id].satisfied + a.supply
+
+    return results;
@@ -11,19 +11,21 @@ def main():
     assigns = solve(drones, depots, dests)
     print(f'\n - Χρόνος επίλυσης: {time() - start:.2f} sec - ')
 
-    print('\nΒέλτιστες αναθέσεις αποστολών:')
+    lines = ['\nΒέλτιστες αναθέσεις αποστολών:']
     for a in assigns:
         dest_name = dests[a.dest_id].name
         cargo     = a.supply.to_dict()
-        print(
+        lines.append(
             f'Δρόνος {a.drone_id} -> {dest_name:<10} | Απόσταση: {a.distance:5.1f} '
             f"| Φορτίο: {cargo['food']:>3} τρόφιμα, {cargo['water']:>3} νερό, "
             f"{cargo['medicine']:>3} φάρμακα"
         )
 
-    print('\nΠοσοστά κάλυψης προμηθειών ανά προορισμό:')
+    lines.append('\nΠοσοστά κάλυψης προμηθειών ανά προορισμό:')
     for d in dests:
-        print(f'  {d.name:<10}: {d.sat_rate()*100:.1f}%')
+        lines.append(f'  {d.name:<10}: {d.sat_rate()*100:.1f}%')
+
+    print('\n'.join(lines)) # 1 εγγραφή στο stdout αντί για 1 ανά γραμμή
 
     return;
 
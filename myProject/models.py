@@ -15,7 +15,7 @@ class DroneStatus(Enum):
     DELIVERING = 'delivering'
     RETURNING  = 'returning'
 
-@dataclass
+@dataclass(slots = True)
 class Supply:
     ''' Κλάση διαχείρισης προμηθειών '''
     food:     int = 0
@@ -42,7 +42,15 @@ class Supply:
             'medicine': self.medicine
         };
 
-@dataclass
+    # Οι ποσότητες με τη σειρά food, water, medicine [ίδια με lp_solver.supply_types]
+    def as_tuple(self) -> tuple:
+        return (self.food, self.water, self.medicine);
+
+    # Γρήγορο αντίγραφο - Αντί για copy.deepcopy [γενικό & αργό]
+    def clone(self) -> 'Supply':
+        return Supply(self.food, self.water, self.medicine);
+
+@dataclass(slots = True)
 class Location:
     ''' Γενική κλάση τοποθεσίας - ρόλος γονέα '''
     id:   int
@@ -54,11 +62,14 @@ class Location:
         # Ευκλείδεια απόσταση
         return math.hypot(self.x - other.x, self.y - other.y);
 
-@dataclass
+@dataclass(slots = True)
 class Depot(Location):
     ''' Κλάση σημείου εφοδιασμού - κληρονομεί από Location '''
     supply: Supply = field(default_factory = Supply)
 
+    def clone(self) -> 'Depot':
+        return Depot(self.id, self.x, self.y, self.name, self.supply.clone());
+
     def __str__(self) -> str:
         temp = self.supply.to_dict()
         return (
@@ -66,7 +77,7 @@ class Depot(Location):
             f'Προμήθεια: {temp["food"]:>3} τ, {temp["water"]:>3} ν, {temp["medicine"]:>3} φ'
         );
 
-@dataclass
+@dataclass(slots = True)
 class Destination(Location):
     ''' Κλάση σημείου ανάγκης - κληρονομεί από Location '''
     demand:    Supply   = field(default_factory = Supply)
@@ -77,6 +88,10 @@ class Destination(Location):
         tot = self.demand.total()
         return 1 if tot == 0 else self.satisfied.total() / tot;
 
+    def clone(self) -> 'Destination':
+        return Destination(self.id, self.x, self.y, self.name,
+                           self.demand.clone(), self.satisfied.clone(), self.priority);
+
     def __str__(self) -> str:
         temp = self.demand.to_dict()
         return (
@@ -85,7 +100,7 @@ class Destination(Location):
             f'Προτεραιότητα: {self.priority.name}'
         );
 
-@dataclass
+@dataclass(slots = True)
 class Drone:
     ''' Κλάση δρόνος - αναπαράσταση του αποστολέα '''
     id:       int
@@ -106,7 +121,7 @@ class Drone:
             f'Ταχύτητα: {self.speed:>3} - Κατάσταση: {self.status.value}'
         );
 
-@dataclass
+@dataclass(slots = True)
 class Assignment:
     ''' Αντιπροσωπεύει μία λύση του προβλήματος, δρόνος -> αποστολή/ανάθεση '''
     drone_id: int
@@ -115,3 +130,7 @@ class Assignment:
     supply:   Supply
     distance: float
     cost:     float
+
+    def clone(self) -> 'Assignment':
+        return Assignment(self.drone_id, self.depot_id, self.dest_id,
+                          self.supply.clone(), self.distance, self.cost);
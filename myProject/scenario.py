@@ -4,7 +4,7 @@ from models import Supply, Priority, Drone, Depot, Destination
 
 # Για να δημιουργηθεί 1 σενάριο, καλό θα
 # ήταν να χρησιμοποιηθεί η δομή που ακολουθεί:
-def sample_scenario():
+def sample_scenario(verbose: bool = True):
     drones = [
         Drone(0, 0, 0, 100, 300, 50),
         Drone(1, 0, 0,  80, 250, 60),
@@ -20,11 +20,12 @@ def sample_scenario():
         Destination(3,  70, 30,    'Clinic', Supply(20, 10,  5), priority = Priority.HIGH  )
     ]
 
-    print_scenario_info(drones, depots, dests)
+    if verbose: # verbose = False => Χωρίς εκτυπώσεις [π.χ. επαναλαμβανόμενες κλήσεις]
+        print_scenario_info(drones, depots, dests)
     
     return (drones, depots, dests);
 
-def big_city_scenario():
+def big_city_scenario(verbose: bool = True):
     drones = [
         Drone(0,  40.0, 23.0, 120, 300, 60),
         Drone(1, 115.0, 17.0, 100, 280, 55),
@@ -57,11 +58,12 @@ def big_city_scenario():
         )
     ]
 
-    print_scenario_info(drones, depots, dests)
+    if verbose:
+        print_scenario_info(drones, depots, dests)
 
     return (drones, depots, dests);
 
-def silent_hill_scenario():
+def silent_hill_scenario(verbose: bool = True):
     drones = [
         Drone(0, 68, -78,  50,  50, 50),
         Drone(1, 68, -78, 100,  70, 60),
@@ -100,11 +102,12 @@ def silent_hill_scenario():
         )
     ]
 
-    print_scenario_info(drones, depots, dests)
+    if verbose:
+        print_scenario_info(drones, depots, dests)
 
     return (drones, depots, dests);
 
-def raccoon_city_scenario():
+def raccoon_city_scenario(verbose: bool = True):
     drones = [
         Drone(0,  48.5, -42.6, 100, 300, 60),
         Drone(1, -37.8, 109.4, 120, 350, 70),
@@ -131,7 +134,8 @@ def raccoon_city_scenario():
         ),
     ]
 
-    print_scenario_info(drones, depots, dests)
+    if verbose:
+        print_scenario_info(drones, depots, dests)
 
     return (drones, depots, dests);
 
@@ -141,12 +145,11 @@ def print_scenario_info(drones: list[Drone],
                         dests:  list[Destination]) -> None:
     ''' Βοηθητική συνάρτηση για την εκτύπωση πληροφοριών σεναρίου. '''
 
-    print('-> Πληροφορίες για το δοκιμαστικό σενάριο:')
-    for depot in depots:
-        print(depot)
-    for drone in drones:
-        print(drone)
-    for dest in dests:
-        print(dest)
+    lines = ['-> Πληροφορίες για το δοκιμαστικό σενάριο:']
+    lines.extend(map(str, depots))
+    lines.extend(map(str, drones))
+    lines.extend(map(str, dests))
+
+    print('\n'.join(lines)) # 1 εγγραφή στο stdout αντί για 1 ανά γραμμή
 
     return;